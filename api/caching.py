@@ -0,0 +1,33 @@
+import hashlib
+
+from django.db.models import Count, Max
+
+from .models import File
+
+ANALYTICS_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def analytics_list_stats():
+    """
+    Return the max File ID and row count as ``{"m": ..., "c": ...}``.
+
+    The pipeline only ever inserts File rows, so together they identify the
+    list contents with one indexed aggregate.
+    """
+    return File.objects.aggregate(m=Max("id"), c=Count("id"))
+
+
+def analytics_list_etag(stats, absolute_uri):
+    """
+    Build the ETag for an analytics list page.
+
+    ``absolute_uri`` includes scheme and host because the paginated body
+    embeds absolute next/previous links built from them.
+    """
+    raw = f"{stats['m']}:{stats['c']}:{absolute_uri}"
+    return '"%s"' % hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+
+def analytics_page_cache_key(stats, page_number):
+    """Cache key for the encoded rows of one analytics list page."""
+    return f"analytics:list:{stats['m']}:{stats['c']}:{page_number}"
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce
 
 
 class Topic(models.Model):
@@ -13,6 +15,18 @@ class Topic(models.Model):
         return self.name
 
 
+class FileQuerySet(models.QuerySet):
+    """Query helpers for the File table."""
+
+    def with_topic_name(self):
+        """Annotate the topic name as a flat column, defaulting to "Unknown"."""
+        return self.annotate(
+            topic_name=Coalesce(
+                F("topic__name"), Value("Unknown"), output_field=models.TextField()
+            )
+        )
+
+
 class File(models.Model):
     """Maps to the existing File table."""
     name = models.TextField(db_column="Name")
@@ -50,6 +64,13 @@ class File(models.Model):
     summary = models.TextField(db_column="Summary")
     conflict = models.IntegerField(db_column="Conflict")
     silence = models.FloatField(db_column="Silence")
+    # Utterance aggregates written by the pipeline alongside the File row
+    utt_count = models.IntegerField(null=True, db_column="UtteranceCount")
+    sent_pos = models.IntegerField(null=True, db_column="PositiveCount")
+    sent_neg = models.IntegerField(null=True, db_column="NegativeCount")
+    sent_neu = models.IntegerField(null=True, db_column="NeutralCount")
+
+    objects = FileQuerySet.as_manager()
 
     class Meta:
         managed = False
@@ -97,6 +118,7 @@ class Job(models.Model):
         File, on_delete=models.SET_NULL, null=True, blank=True, related_name="jobs"
     )
     error_message = models.TextField(blank=True)
+    content_sha256 = models.CharField(max_length=64, blank=True, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
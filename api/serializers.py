@@ -20,8 +20,17 @@ class UtteranceSerializer(serializers.ModelSerializer):
 
 
 def _sentiment_summary(file_obj):
-    """Build a sentiment distribution dict for a File's utterances."""
-    sentiments = file_obj.utterances.values_list("sentiment", flat=True)
+    """
+    Build a sentiment distribution dict for a File's utterances.
+
+    Reuses prefetched utterances when available; ``values_list`` would
+    bypass the prefetch cache and hit the database again.
+    """
+    prefetched = getattr(file_obj, "_prefetched_objects_cache", {}).get("utterances")
+    if prefetched is not None:
+        sentiments = (u.sentiment for u in prefetched)
+    else:
+        sentiments = file_obj.utterances.values_list("sentiment", flat=True)
     counts = Counter(sentiments)
     total = sum(counts.values())
     return {
@@ -32,11 +41,33 @@ def _sentiment_summary(file_obj):
     }
 
 
+class SentimentCountsField(serializers.Field):
+    """Read-only field rendering the stored sentiment counts of a File."""
+
+    def __init__(self, **kwargs):
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, obj):
+        return {
+            "positive": obj.sent_pos,
+            "negative": obj.sent_neg,
+            "neutral": obj.sent_neu,
+            "total": obj.utt_count,
+        }
+
+
 class FileListSerializer(serializers.ModelSerializer):
-    """Lightweight serializer for listing all call analytics."""
-    topic_name = serializers.CharField(source="topic.name", default="Unknown")
-    utterance_count = serializers.SerializerMethodField()
-    sentiment = serializers.SerializerMethodField()
+    """
+    Lightweight serializer for listing all call analytics.
+
+    Expects a queryset built with ``File.objects.with_topic_name()``; the
+    counts are stored on the File row, so every field is a flat column read.
+    """
+    topic_name = serializers.CharField(read_only=True)
+    utterance_count = serializers.IntegerField(source="utt_count", read_only=True)
+    sentiment = SentimentCountsField()
 
     class Meta:
         model = File
@@ -46,12 +77,6 @@ class FileListSerializer(serializers.ModelSerializer):
             "utterance_count", "sentiment",
         ]
 
-    def get_utterance_count(self, obj):
-        return obj.utterances.count()
-
-    def get_sentiment(self, obj):
-        return _sentiment_summary(obj)
-
 
 class FileDetailSerializer(serializers.ModelSerializer):
     """Full serializer with utterances for a single call."""
@@ -1,9 +1,57 @@
 import os
-import threading
+import hashlib
 import requests
 import asyncio
+from functools import lru_cache
+from datetime import timedelta
 from urllib.parse import urlparse
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from celery import shared_task
+from celery.exceptions import SoftTimeLimitExceeded
+from celery.signals import worker_init
+from kombu.exceptions import OperationalError
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from api.models import Job
+
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+
+@lru_cache(maxsize=None)
+def _pipeline_main():
+    """Import the Callytics pipeline entry point once per process."""
+    from main import main
+    return main
+
+
+@worker_init.connect
+def _preload_pipeline(**kwargs):
+    """Pay the pipeline import cost before the worker forks its pool."""
+    _pipeline_main()
+
+
+def _has_dialogue(audio_path):
+    """Run the cheap RMS turn-taking check before loading the ASR/LLM pipeline."""
+    from src.audio.error import DialogueDetecting
+    return DialogueDetecting(skip_if_no_dialogue=True).process(audio_path)
 
 
 def _get_filename_from_url(url):
@@ -16,58 +64,122 @@ def _get_filename_from_url(url):
 
 
 def _download_file(url, dest_path):
-    """Download a file from a URL to a local path."""
-    response = requests.get(url, stream=True, timeout=300)
-    response.raise_for_status()
-    with open(dest_path, "wb") as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            f.write(chunk)
-
-
-def _run_pipeline(job_id):
-    """Run the Callytics pipeline for a job in a background thread."""
-    import django
-    django.setup()
-
-    from api.models import Job, File
-
+    """Download a file from a URL to a local path and return its SHA-256 hex digest."""
+    hasher = hashlib.sha256()
+    with _SESSION.get(url, stream=True, timeout=(5, 300)) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        with open(dest_path, "wb") as f:
+            for chunk in iter(lambda: response.raw.read(_DOWNLOAD_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+                f.write(chunk)
+    return hasher.hexdigest()
+
+
+def _update_job(job_id, **fields):
+    """Write only the given Job columns in a single UPDATE, touching updated_at."""
+    Job.objects.filter(pk=job_id).update(updated_at=timezone.now(), **fields)
+
+
+def _claim_job(job_id):
+    """
+    Move a job to "processing" and return True if this delivery now owns it.
+
+    A pending job is claimed, as is one left "processing" for longer than the
+    hard time limit, whose worker must have died. A job that is finished or
+    still running elsewhere is left alone, so duplicate deliveries are no-ops.
+    """
+    now = timezone.now()
+    stale = now - timedelta(seconds=settings.CELERY_TASK_TIME_LIMIT)
+    claimed = Job.objects.filter(
+        Q(status="pending") | Q(status="processing", updated_at__lt=stale),
+        pk=job_id,
+    ).update(status="processing", updated_at=now)
+    return claimed == 1
+
+
+@shared_task(bind=True, max_retries=2, acks_late=True)
+def run_pipeline(self, job_id):
+    """Run the Callytics pipeline for a job on a Celery worker."""
+    if not _claim_job(job_id):
+        return
     job = Job.objects.get(pk=job_id)
 
     try:
-        job.status = "processing"
-        job.save()
+        file_name = _get_filename_from_url(job.file_url)
+        _update_job(job_id, file_name=file_name)
 
         input_dir = Path(".data/input")
         input_dir.mkdir(parents=True, exist_ok=True)
 
-        file_name = _get_filename_from_url(job.file_url)
-        job.file_name = file_name
-        job.save()
-
         audio_path = str(input_dir / f"job_{job_id}_{file_name}")
-        _download_file(job.file_url, audio_path)
-
-        from main import main as callytics_main
-        asyncio.run(callytics_main(audio_path))
-
-        latest_file = File.objects.order_by("-id").first()
-        if latest_file:
-            job.result_file = latest_file
-        job.status = "completed"
-        job.save()
+        content_sha256 = _download_file(job.file_url, audio_path)
+
+        # Identical audio was already processed; reuse its result.
+        existing_file_id = (
+            Job.objects.filter(
+                content_sha256=content_sha256,
+                status="completed",
+                result_file__isnull=False,
+            )
+            .exclude(pk=job_id)
+            .values_list("result_file_id", flat=True)
+            .first()
+        )
+        if existing_file_id is not None:
+            os.remove(audio_path)
+            _update_job(
+                job_id,
+                status="completed",
+                content_sha256=content_sha256,
+                result_file_id=existing_file_id,
+            )
+            return
+
+        if not _has_dialogue(audio_path):
+            os.remove(audio_path)
+            _update_job(
+                job_id,
+                status="completed",
+                content_sha256=content_sha256,
+                error_message="no dialogue",
+            )
+            return
 
     except Exception as e:
-        job.status = "failed"
-        job.error_message = str(e)[:2000]
-        job.save()
+        if self.request.retries < self.max_retries and not isinstance(e, SoftTimeLimitExceeded):
+            # Hand the job back so the retried delivery can claim it
+            _update_job(job_id, status="pending")
+            raise self.retry(exc=e, countdown=60)
+        _update_job(job_id, status="failed", error_message=str(e)[:2000])
+        return
+
+    # Never retried: main() commits the File row before its Utterance rows,
+    # so running it again after a failure part-way would insert a second File.
+    try:
+        callytics_main = _pipeline_main()
+        file_id = asyncio.run(callytics_main(audio_path, detect_dialogue=False))
+    except Exception as e:
+        _update_job(job_id, status="failed", error_message=str(e)[:2000])
+        return
+
+    _update_job(
+        job_id,
+        status="completed",
+        content_sha256=content_sha256,
+        result_file_id=file_id,
+    )
 
 
 def start_pipeline_job(job_id):
-    """Launch the pipeline in a background thread."""
-    thread = threading.Thread(
-        target=_run_pipeline,
-        args=(job_id,),
-        daemon=True,
-    )
-    thread.start()
-    return thread
+    """
+    Queue the pipeline for a job on the Celery worker pool.
+
+    Returns None and marks the job failed when the broker cannot be reached,
+    rather than leaving it pending with no task behind it.
+    """
+    try:
+        return run_pipeline.delay(job_id)
+    except OperationalError as e:
+        _update_job(job_id, status="failed", error_message=f"could not queue job: {e}"[:2000])
+        return None
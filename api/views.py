@@ -1,8 +1,20 @@
+import orjson
+from django.core.cache import cache
+from django.db.models import Prefetch
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
 from rest_framework import generics, status
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from rest_framework.views import APIView
 
-from .models import File, Job
+from .caching import (
+    ANALYTICS_CACHE_TIMEOUT,
+    analytics_list_etag,
+    analytics_list_stats,
+    analytics_page_cache_key,
+)
+from .models import File, Job, Utterance
 from .serializers import (
     FileListSerializer,
     FileDetailSerializer,
@@ -12,6 +24,43 @@ from .serializers import (
 from .tasks import start_pipeline_job
 
 
+_ANALYTICS_LIST_COLUMNS = (
+    "id", "name", "extension", "duration", "topic_name", "summary",
+    "conflict", "silence", "utt_count", "sent_pos", "sent_neg", "sent_neu",
+)
+
+
+def _analytics_row(values):
+    """Shape one _ANALYTICS_LIST_COLUMNS tuple like FileListSerializer output."""
+    (pk, name, extension, duration, topic_name, summary,
+     conflict, silence, utt_count, sent_pos, sent_neg, sent_neu) = values
+    return {
+        "id": pk,
+        "name": name,
+        "extension": extension,
+        "duration": duration,
+        "topic_name": topic_name,
+        "summary": summary,
+        "conflict": conflict,
+        "silence": silence,
+        "utterance_count": utt_count,
+        "sentiment": {
+            "positive": sent_pos,
+            "negative": sent_neg,
+            "neutral": sent_neu,
+            "total": utt_count,
+        },
+    }
+
+
+_jobs_with_results = Job.objects.prefetch_related(
+    Prefetch(
+        "result_file",
+        queryset=File.objects.with_topic_name(),
+    )
+)
+
+
 class AnalyzeView(APIView):
     """
     POST /api/analyze/
@@ -31,7 +80,12 @@ class AnalyzeView(APIView):
             file_url=serializer.validated_data["file_url"],
         )
 
-        start_pipeline_job(job.id)
+        if start_pipeline_job(job.id) is None:
+            job.refresh_from_db()
+            return Response(
+                JobSerializer(job).data,
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
 
         return Response(
             JobSerializer(job).data,
@@ -44,7 +98,7 @@ class JobDetailView(generics.RetrieveAPIView):
     GET /api/jobs/<id>/
     Check the status of a processing job.
     """
-    queryset = Job.objects.all()
+    queryset = _jobs_with_results
     serializer_class = JobSerializer
 
 
@@ -53,7 +107,7 @@ class JobListView(generics.ListAPIView):
     GET /api/jobs/
     List all processing jobs.
     """
-    queryset = Job.objects.all()
+    queryset = _jobs_with_results
     serializer_class = JobSerializer
 
 
@@ -61,15 +115,110 @@ class AnalyticsListView(generics.ListAPIView):
     """
     GET /api/analytics/
     List all processed call analytics.
+
+    Rows are read with ``values_list`` and encoded with orjson, bypassing
+    serializer instances; the output matches FileListSerializer.
     """
-    queryset = File.objects.select_related("topic").all()
+    queryset = File.objects.with_topic_name()
     serializer_class = FileListSerializer
 
+    def list(self, request, *args, **kwargs):
+        stats = analytics_list_stats()
+        # The body carries absolute next/previous links, so tag the full URI
+        etag = analytics_list_etag(stats, request.build_absolute_uri())
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponseNotModified()
+            response["ETag"] = etag
+            return response
+
+        page = self._requested_page(stats["c"])
+        if page is None:
+            body = orjson.dumps(self._list_data())
+        else:
+            body = self._page_body(stats, *page)
+
+        response = HttpResponse(body, content_type="application/json")
+        response["ETag"] = etag
+        return response
+
+    def _requested_page(self, count):
+        """
+        Return ``(number, size, num_pages)`` when ``page`` names an existing page.
+
+        Anything else (pagination disabled, a malformed or out-of-range page)
+        returns None and goes through the paginator uncached, so only real
+        pages ever get a cache entry.
+        """
+        paginator = self.paginator
+        if paginator is None:
+            return None
+        size = paginator.get_page_size(self.request)
+        if not size:
+            return None
+        num_pages = max(1, -(-count // size))
+
+        value = self.request.query_params.get(paginator.page_query_param, "1")
+        if value in paginator.last_page_strings:
+            return num_pages, size, num_pages
+        if not (value.isascii() and value.isdigit()):
+            return None
+        number = int(value)
+        if not 1 <= number <= num_pages:
+            return None
+        return number, size, num_pages
+
+    def _page_body(self, stats, number, size, num_pages):
+        """
+        Encode one page, reusing the cached rows and building the links per request.
+
+        Only the rows are cached, keyed on the page, so the cache stays bounded by
+        the number of pages whatever Host or query string the client sends.
+        """
+        cache_key = analytics_page_cache_key(stats, f"{number}:{size}")
+        rows = cache.get(cache_key)
+        if rows is None:
+            start = (number - 1) * size
+            queryset = self.filter_queryset(self.get_queryset())
+            queryset = queryset.values_list(*_ANALYTICS_LIST_COLUMNS)[start:start + size]
+            rows = orjson.dumps([_analytics_row(row) for row in queryset])
+            cache.set(cache_key, rows, timeout=ANALYTICS_CACHE_TIMEOUT)
+
+        url = self.request.build_absolute_uri()
+        param = self.paginator.page_query_param
+        next_link = replace_query_param(url, param, number + 1) if number < num_pages else None
+        if number == 1:
+            previous_link = None
+        elif number == 2:
+            previous_link = remove_query_param(url, param)
+        else:
+            previous_link = replace_query_param(url, param, number - 1)
+
+        head = orjson.dumps({"count": stats["c"], "next": next_link, "previous": previous_link})
+        return head[:-1] + b',"results":' + rows + b"}"
+
+    def _list_data(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        queryset = queryset.values_list(*_ANALYTICS_LIST_COLUMNS)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response([_analytics_row(row) for row in page]).data
+
+        return [_analytics_row(row) for row in queryset]
+
 
 class AnalyticsDetailView(generics.RetrieveAPIView):
     """
     GET /api/analytics/<id>/
     Get full details for a single call, including all utterances.
     """
-    queryset = File.objects.select_related("topic").prefetch_related("utterances").all()
+    queryset = File.objects.select_related("topic").prefetch_related(
+        Prefetch(
+            "utterances",
+            queryset=Utterance.objects.only(
+                "id", "file_id", "speaker", "sequence", "start_time",
+                "end_time", "content", "sentiment", "profane",
+            ),
+        )
+    )
     serializer_class = FileDetailSerializer
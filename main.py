@@ -1,6 +1,7 @@
 # Standard library imports
 import os
 import gc
+from collections import Counter
 
 # Related third-party imports
 import torch
@@ -23,7 +24,7 @@ from src.utils.utils import Cleaner, Watcher
 from src.db.manager import Database
 
 
-async def main(audio_file_path: str):
+async def main(audio_file_path: str, detect_dialogue: bool = True):
     """
     Process an audio file to perform diarization, transcription, punctuation restoration,
     and speaker role classification.
@@ -32,10 +33,14 @@ async def main(audio_file_path: str):
     ----------
     audio_file_path : str
         The path to the input audio file to be processed.
+    detect_dialogue : bool, optional
+        Whether to run the dialogue check first. Callers that already ran it can
+        skip it. Defaults to True.
 
     Returns
     -------
-    None
+    int or None
+        The ID of the inserted File row, or None if no dialogue was detected.
     """
     # Paths
     config_nemo = "config/nemo/diar_infer_telephonic.yaml"
@@ -58,7 +63,6 @@ async def main(audio_file_path: str):
     os.environ["PYTORCH_CUDA_ALLOC_CONF"] = config.runtime.cuda_alloc_conf
 
     # Initialize Classes
-    dialogue_detector = DialogueDetecting(delete_original=True)
     enhancer = SpeechEnhancement(config_path=config_path, output_dir=temp_dir)
     separator = DemucsVocalSeparator()
     processor = AudioProcessor(audio_path=audio_file_path, temp_dir=temp_dir)
@@ -72,12 +76,14 @@ async def main(audio_file_path: str):
     audio_feature_extractor = Audio(audio_file_path)
 
     # Step 1: Detect Dialogue
-    has_dialogue = dialogue_detector.process(audio_file_path)
-    del dialogue_detector
-    gc.collect()
-    torch.cuda.empty_cache() if torch.cuda.is_available() else None
-    if not has_dialogue:
-        return
+    if detect_dialogue:
+        dialogue_detector = DialogueDetecting(delete_original=True)
+        has_dialogue = dialogue_detector.process(audio_file_path)
+        del dialogue_detector
+        gc.collect()
+        torch.cuda.empty_cache() if torch.cuda.is_available() else None
+        if not has_dialogue:
+            return None
 
     # Step 2: Speech Enhancement
     audio_path = enhancer.enhance_audio(
@@ -161,19 +167,15 @@ async def main(audio_file_path: str):
     ssm_with_indices = formatter.add_indices_to_ssm(ssm)
     annotator = Annotator(ssm_with_indices)
     sentiment_results = await llm_handler.generate("SentimentAnalysis", user_input=ssm)
-    annotator.add_sentiment(sentiment_results)
 
     # Step 11: Profanity Word Detection
     profane_results = await llm_handler.generate("ProfanityWordDetection", user_input=ssm)
-    annotator.add_profanity(profane_results)
 
     # Step 12: Summary
     summary_result = await llm_handler.generate("Summary", user_input=ssm)
-    annotator.add_summary(summary_result)
 
     # Step 13: Conflict Detection
     conflict_result = await llm_handler.generate("ConflictDetection", user_input=ssm)
-    annotator.add_conflict(conflict_result)
 
     #  Step 14: File/Audio Feature Extraction
     props = audio_feature_extractor.properties()
@@ -201,20 +203,20 @@ async def main(audio_file_path: str):
     eq_6000_20000_db = final_features["EQ_6000_20000_Hz"]
     mfcc_values = [final_features[f"MFCC_{i}"] for i in range(1, 14)]
 
-    final_output = annotator.finalize()
+    final_output = annotator.apply(sentiment_results, profane_results, summary_result, conflict_result)
 
     # Step 15: Total Silence Calculation
     stats = SilenceStats.from_segments(final_output['ssm'])
     t_std = stats.threshold_std(factor=0.99)
-    final_output["silence"] = t_std
 
-    print("Final_Output:", final_output)
+    print("Final_Output:", {**final_output, "silence": t_std})
 
     # Step 16: Database
     # Step 16.1: Insert File Table
     summary = final_output.get("summary", "")
     conflict_flag = 1 if final_output.get("conflict", False) else 0
-    silence_value = final_output.get("silence", 0.0)
+    silence_value = t_std
+    sentiment_counts = Counter(u.get("sentiment", "Neutral") for u in final_output["ssm"])
 
     params = (
         name,
@@ -236,7 +238,11 @@ async def main(audio_file_path: str):
         *mfcc_values,
         summary,
         conflict_flag,
-        silence_value
+        silence_value,
+        len(final_output["ssm"]),
+        sentiment_counts["Positive"],
+        sentiment_counts["Negative"],
+        sentiment_counts["Neutral"]
     )
 
     last_id = db.insert(db_audio_properties_insert_path, params)
@@ -244,6 +250,7 @@ async def main(audio_file_path: str):
 
     # Step 16.2: Insert Utterance Table
     utterances = final_output["ssm"]
+    utterance_params = []
 
     for utterance in utterances:
         file_id = last_id
@@ -255,7 +262,7 @@ async def main(audio_file_path: str):
         sentiment = utterance.get("sentiment", "Neutral")
         profane = 1 if utterance.get("profane", False) else 0
 
-        utterance_params = (
+        utterance_params.append((
             file_id,
             speaker,
             sequence,
@@ -264,15 +271,17 @@ async def main(audio_file_path: str):
             content,
             sentiment,
             profane
-        )
+        ))
 
-        db.insert(db_utterance_insert_path, utterance_params)
+    db.insert_many(db_utterance_insert_path, utterance_params)
 
     print("Utterances inserted successfully into the Utterance table.")
 
     # Step 17: Clean Up
     cleaner.cleanup(temp_dir, audio_file_path)
 
+    return last_id
+
 
 async def process(path: str):
     """
@@ -7,6 +7,8 @@ from typing import Annotated
 # Related third party imports
 import numpy as np
 import librosa
+import soundfile as sf
+from scipy.signal import resample_poly
 
 logging.basicConfig(level=logging.INFO)
 
@@ -89,6 +91,93 @@ class DialogueDetecting:
         )
         return float(result.stdout.strip())
 
+    def _load_mono(self, audio_path: str) -> np.ndarray:
+        """
+        Load an audio file as a mono float32 signal at ``self.sample_rate``.
+
+        Decodes with libsndfile and resamples with a polyphase filter, falling
+        back to librosa for formats libsndfile cannot read.
+
+        Parameters
+        ----------
+        audio_path : str
+            Path to the audio file.
+
+        Returns
+        -------
+        np.ndarray
+            Mono signal sampled at ``self.sample_rate``.
+        """
+        try:
+            y, sr = sf.read(audio_path, dtype="float32", always_2d=False)
+        except (sf.LibsndfileError, RuntimeError):
+            y, _ = librosa.load(audio_path, sr=self.sample_rate, mono=True)
+            return y
+
+        if y.ndim > 1:
+            y = y.mean(axis=1)
+        if sr != self.sample_rate:
+            g = np.gcd(int(sr), int(self.sample_rate))
+            y = resample_poly(y, self.sample_rate // g, sr // g).astype(np.float32)
+        return y
+
+    @staticmethod
+    def _frame_rms(y: np.ndarray, frame_length: int, hop_length: int) -> np.ndarray:
+        """
+        Compute centered, zero-padded per-frame RMS energy.
+
+        Uses a running sum of squares so every frame costs two lookups instead
+        of a pass over ``frame_length`` samples. Frames line up with
+        ``librosa.feature.rms`` with ``center=True``.
+
+        Parameters
+        ----------
+        y : np.ndarray
+            Mono signal.
+        frame_length : int
+            Samples per analysis frame.
+        hop_length : int
+            Samples between successive frames.
+
+        Returns
+        -------
+        np.ndarray
+            RMS value of each frame.
+        """
+        pad = frame_length // 2
+        squares = np.zeros(len(y) + 2 * pad + 1, dtype=np.float64)
+        np.cumsum(np.square(y, dtype=np.float64), out=squares[pad + 1:pad + 1 + len(y)])
+        squares[pad + 1 + len(y):] = squares[pad + len(y)]
+
+        starts = np.arange(0, len(y) + 2 * pad - frame_length + 1, hop_length)
+        energy = (squares[starts + frame_length] - squares[starts]) / frame_length
+        return np.sqrt(np.maximum(energy, 0.0))
+
+    @staticmethod
+    def _speech_edges(is_speech: np.ndarray):
+        """
+        Locate speech runs in a boolean frame mask with a single XOR scan.
+
+        XOR-ing the mask (padded with a silent frame on each side) against
+        itself shifted by one frame marks every transition. Transitions
+        alternate rise/fall, so starts and ends come out of one nonzero pass.
+
+        Parameters
+        ----------
+        is_speech : np.ndarray
+            Boolean mask, True for speech frames.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            Start (inclusive) and end (exclusive) frame indices of each run.
+        """
+        padded = np.zeros(is_speech.size + 2, dtype=bool)
+        padded[1:-1] = is_speech
+        transitions = np.flatnonzero(padded[1:] ^ padded[:-1])
+
+        return transitions[0::2], transitions[1::2]
+
     def _detect_speech_segments(self, audio_path: str):
         """
         Detect speech and silence segments using RMS energy thresholding.
@@ -103,35 +192,24 @@ class DialogueDetecting:
         int
             Number of speech-to-silence-to-speech transitions (speaker turns).
         """
-        y, sr = librosa.load(audio_path, sr=self.sample_rate, mono=True)
+        y = self._load_mono(audio_path)
+        sr = self.sample_rate
 
         frame_length = int(0.025 * sr)
         hop_length = int(0.010 * sr)
-        rms = librosa.feature.rms(y=y, frame_length=frame_length, hop_length=hop_length)[0]
+        rms = self._frame_rms(y, frame_length, hop_length)
 
         threshold = np.mean(rms) * 0.5
         is_speech = rms > threshold
 
         min_silence_frames = int(self.min_silence_duration / (hop_length / sr))
 
-        turn_count = 0
-        silence_count = 0
-        in_speech = False
-
-        for frame_is_speech in is_speech:
-            if frame_is_speech:
-                if not in_speech and silence_count >= min_silence_frames:
-                    turn_count += 1
-                in_speech = True
-                silence_count = 0
-            else:
-                if in_speech:
-                    silence_count = 1
-                    in_speech = False
-                else:
-                    silence_count += 1
-
-        return turn_count
+        # A turn is a speech run preceded by at least min_silence_frames of
+        # silence (leading silence counts from the first frame).
+        starts, ends = self._speech_edges(is_speech)
+        silence_lens = starts - np.concatenate(([0], ends[:-1]))
+
+        return int(np.count_nonzero(silence_lens >= min_silence_frames))
 
     def process(self, audio_file: Annotated[str, "Path to the input audio file"]) -> Annotated[
         bool, "True if dialogue detected, False otherwise"]:
@@ -157,17 +235,17 @@ class DialogueDetecting:
         >>> dialogue_detector.process("example.wav")
         True
         """
-        logging.info(f"Detecting dialogue in: {audio_file}")
+        logging.info("Detecting dialogue in: %s", audio_file)
 
         turn_count = self._detect_speech_segments(audio_file)
-        logging.info(f"Detected {turn_count} speaker turns.")
+        logging.info("Detected %d speaker turns.", turn_count)
 
         has_dialogue = turn_count >= self.min_turn_count
 
         if not has_dialogue:
             logging.info("No dialogue detected or insufficient speaker turns.")
             if self.delete_original:
-                logging.info(f"No dialogue found. Deleting original file: {audio_file}")
+                logging.info("No dialogue found. Deleting original file: %s", audio_file)
                 os.remove(audio_file)
             if self.skip_if_no_dialogue:
                 logging.info("Skipping further processing due to lack of dialogue.")
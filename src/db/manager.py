@@ -1,6 +1,15 @@
 # Standard library imports
 import sqlite3
-from typing import Annotated, List, Tuple, Optional
+import threading
+from functools import lru_cache
+from typing import Annotated, Iterable, List, Tuple, Optional
+
+
+@lru_cache(maxsize=64)
+def _read_sql(sql_file_path: str) -> str:
+    """Reads and caches the contents of an SQL file."""
+    with open(sql_file_path, encoding='utf-8') as f:
+        return f.read()
 
 
 class Database:
@@ -8,6 +17,7 @@ class Database:
     A class to interact with an SQLite database.
 
     This class provides methods to fetch data and insert data into a database.
+    Each thread reuses a single connection opened in WAL mode.
 
     Parameters
     ----------
@@ -30,6 +40,25 @@ class Database:
             The path to the SQLite database file.
         """
         self.db_path = db_path
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        """
+        Returns the calling thread's connection, opening it on first use.
+
+        Returns
+        -------
+        sqlite3.Connection
+            A connection in autocommit mode with WAL journaling.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._local.conn = conn
+        return conn
 
     def fetch(
             self,
@@ -55,14 +84,11 @@ class Database:
         >>> print(results)
         [(1, 'data1'), (2, 'data2')]
         """
-        with open(sql_file_path, encoding='utf-8') as f:
-            query = f.read()
+        query = _read_sql(sql_file_path)
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn().cursor()
         cursor.execute(query)
         results = cursor.fetchall()
-        conn.close()
 
         return results
 
@@ -93,17 +119,56 @@ class Database:
         >>> print(last_id)
         3
         """
-        with open(sql_file_path, encoding='utf-8') as f:
-            query = f.read()
+        query = _read_sql(sql_file_path)
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn().cursor()
         if params is not None:
             cursor.execute(query, params)
         else:
             cursor.execute(query)
-        conn.commit()
         last_id = cursor.lastrowid
-        conn.close()
         return last_id
 
+    def insert_many(
+            self,
+            sql_file_path: Annotated[str, "Path to the SQL file"],
+            params_seq: Annotated[Iterable[Tuple], "Parameters for each row"]
+    ) -> Annotated[range, "IDs of the inserted rows"]:
+        """
+        Executes an INSERT query from an SQL file once per parameter tuple
+        inside a single transaction and returns the inserted row IDs.
+
+        Parameters
+        ----------
+        sql_file_path : str
+            Path to the SQL file containing the INSERT query.
+        params_seq : iterable of tuple
+            Parameters for each row to insert.
+
+        Returns
+        -------
+        range
+            The IDs of the inserted rows.
+
+        Examples
+        --------
+        >>> db = Database("example.db")
+        >>> ids = db.insert_many("insert_query.sql", [("a", 1), ("b", 2)])
+        >>> print(list(ids))
+        [4, 5]
+        """
+        query = _read_sql(sql_file_path)
+
+        conn = self._conn()
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        try:
+            cursor.executemany(query, params_seq)
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
+
+        first_id = last_id - cursor.rowcount + 1
+        return range(first_id, last_id + 1)
@@ -29,5 +29,9 @@ INSERT INTO File (Name,
                   MFCC_13,
                   Summary,
                   Conflict,
-                  Silence)
-VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+                  Silence,
+                  UtteranceCount,
+                  PositiveCount,
+                  NegativeCount,
+                  NeutralCount)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
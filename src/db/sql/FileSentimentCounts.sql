@@ -0,0 +1,10 @@
+ALTER TABLE File ADD COLUMN UtteranceCount INTEGER;
+ALTER TABLE File ADD COLUMN PositiveCount INTEGER;
+ALTER TABLE File ADD COLUMN NegativeCount INTEGER;
+ALTER TABLE File ADD COLUMN NeutralCount INTEGER;
+
+UPDATE File
+SET UtteranceCount = (SELECT COUNT(*) FROM Utterance u WHERE u.FileID = File.ID),
+    PositiveCount  = (SELECT COUNT(*) FROM Utterance u WHERE u.FileID = File.ID AND u.Sentiment = 'Positive'),
+    NegativeCount  = (SELECT COUNT(*) FROM Utterance u WHERE u.FileID = File.ID AND u.Sentiment = 'Negative'),
+    NeutralCount   = (SELECT COUNT(*) FROM Utterance u WHERE u.FileID = File.ID AND u.Sentiment = 'Neutral');
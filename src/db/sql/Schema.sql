@@ -32,7 +32,11 @@ CREATE TABLE File
     MFCC_13          REAL,
     Summary          TEXT    NOT NULL,
     Conflict         INTEGER NOT NULL CHECK (Conflict IN (0, 1)),
-    Silence          REAL    NOT NULL
+    Silence          REAL    NOT NULL,
+    UtteranceCount   INTEGER,
+    PositiveCount    INTEGER,
+    NegativeCount    INTEGER,
+    NeutralCount     INTEGER
 );
 
 CREATE TABLE Utterance
@@ -1,5 +1,81 @@
 # Standard library imports
-from typing import Annotated, Dict, Any, List
+import sys
+import logging
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Annotated, Dict, Any, List, Mapping, Tuple
+
+# Related third party imports
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Interned so every annotated row shares one str object per label
+SENTIMENT_LABELS = tuple(map(sys.intern, ("Positive", "Negative", "Neutral")))
+CODE_NEUTRAL = SENTIMENT_LABELS.index("Neutral")
+
+
+class _LabelMap(dict):
+    """
+    Label -> int8 code lookup that maps unknown labels to the Neutral code.
+    """
+
+    def __missing__(self, key):
+        return CODE_NEUTRAL
+
+
+SENTIMENT_CODES = _LabelMap((label, code) for code, label in enumerate(SENTIMENT_LABELS))
+
+_get_profane_index = itemgetter("index")
+_get_profane = itemgetter("profane")
+
+
+_NO_INDICES = np.empty(0, dtype=np.int64)
+_NO_CODES = np.empty(0, dtype=np.int8)
+_NO_FLAGS = np.empty(0, dtype=bool)
+
+
+def _fuse(sentiment, sent_set, profane, prof_set, s_idxs, s_codes, p_idxs, p_flags):
+    """
+    Scatters sentiment codes and profanity flags into their columns.
+
+    Every row written is marked in ``sent_set`` / ``prof_set``; later entries
+    win on duplicates. Indices must already be in range (see
+    ``_keep_in_range``).
+    """
+    sentiment[s_idxs] = s_codes
+    sent_set[s_idxs] = True
+    profane[p_idxs] = p_flags
+    prof_set[p_idxs] = True
+
+
+def _all_in_range(idxs: np.ndarray, n: int) -> bool:
+    """
+    Checks ``0 <= idxs < n`` with two reductions instead of a boolean mask.
+    """
+    return not idxs.size or (idxs.min() >= 0 and idxs.max() < n)
+
+
+def _keep_in_range(
+        idxs: np.ndarray,
+        values: np.ndarray,
+        n: int,
+        name: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Drops entries whose index falls outside an SSM of length ``n``.
+
+    Rejected indices are reported in a single warning.
+    """
+    if _all_in_range(idxs, n):
+        return idxs, values
+
+    valid = (0 <= idxs) & (idxs < n)
+    if logger.isEnabledFor(logging.WARNING):
+        skipped = idxs[~valid]
+        logger.warning("Skipping %s data at %d out-of-range indices: %s",
+                       name, skipped.size, skipped[:10].tolist())
+    return idxs[valid], values[valid]
 
 
 class Annotator:
@@ -20,8 +96,24 @@ class Annotator:
         The global summary of the annotations.
     global_conflict : bool
         The global conflict status of the annotations.
+
+    Notes
+    -----
+    Sentiment and profanity are kept as columns (int8 codes into
+    ``SENTIMENT_LABELS`` and bools) alongside the SSM and only written back
+    to the SSM dictionaries in ``finalize``. Rows never assigned by the LLM
+    results keep any value they already had and otherwise default to
+    Neutral / False.
+
+    The ``add_*`` methods return the annotator, so results can be chained:
+    ``Annotator(ssm).add_sentiment(...).add_profanity(...).finalize()``.
     """
 
+    __slots__ = (
+        "ssm", "global_summary", "global_conflict",
+        "_sentiment", "_sent_set", "_profane", "_prof_set"
+    )
+
     def __init__(self, ssm: Annotated[List[Dict[str, Any]], "Structured Sentiment Model"]):
         """
         Initializes the Annotator class with the provided SSM.
@@ -31,66 +123,76 @@ class Annotator:
         ssm : list of dict
             A list of dictionaries representing the structured sentiment model.
         """
+        n = len(ssm)
         self.ssm = ssm
+        self._sentiment = np.full(n, CODE_NEUTRAL, dtype=np.int8)
+        self._sent_set = np.zeros(n, dtype=bool)
+        self._profane = np.zeros(n, dtype=bool)
+        self._prof_set = np.zeros(n, dtype=bool)
         self.global_summary = ""
         self.global_conflict = False
 
-    def add_sentiment(
+    def apply(
             self,
-            sentiment_results: Annotated[Any, "Sentiment analysis results: dict with 'sentiments' key or list of {index, sentiment}"]
-    ):
-        """
-        Adds sentiment data to the SSM. Accepts either {"sentiments": [...]} or a raw list.
-        Handles out-of-range indices by applying in-range ones; if all indices are wrong,
-        assigns by position (first item -> index 0, etc.).
+            sentiment_results: Annotated[Any, "Sentiment analysis results"],
+            profane_results: Annotated[Dict[str, Any], "Profanity detection results"],
+            summary_result: Annotated[Dict[str, str], "Summary results"],
+            conflict_result: Annotated[Dict[str, bool], "Conflict detection results"]
+    ) -> Mapping[str, Any]:
         """
-        # Normalize: accept raw list (LLM sometimes returns array instead of object)
-        if isinstance(sentiment_results, list):
-            sentiments_list = sentiment_results
-        elif sentiment_results and isinstance(sentiment_results, dict) and "sentiments" in sentiment_results:
-            sentiments_list = sentiment_results["sentiments"]
-        else:
-            print("Warning: 'sentiments' key is missing in sentiment_results. Defaulting to Neutral.")
-            for item in self.ssm:
-                item.setdefault("sentiment", "Neutral")
-            return
+        Applies all LLM results in one pass and returns the finalized annotations.
 
-        if not isinstance(sentiments_list, list):
-            for item in self.ssm:
-                item.setdefault("sentiment", "Neutral")
-            return
+        Sentiment and profanity are validated as in ``add_sentiment`` and
+        ``add_profanity`` and then scattered into their columns together.
 
-        n = len(self.ssm)
-        # Ensure each item has "index" and "sentiment"
-        valid_entries = []
-        for entry in sentiments_list:
-            if not isinstance(entry, dict) or "sentiment" not in entry:
-                continue
-            idx = entry.get("index", -1)
-            sent = entry.get("sentiment", "Neutral")
-            if sent not in ("Positive", "Negative", "Neutral"):
-                sent = "Neutral"
-            valid_entries.append((idx, sent))
+        Parameters
+        ----------
+        sentiment_results : dict or list
+            Sentiment analysis results, as accepted by ``add_sentiment``.
+        profane_results : dict
+            Profanity detection results, as accepted by ``add_profanity``.
+        summary_result : dict
+            A dictionary containing a "summary" key with the summary text.
+        conflict_result : dict
+            A dictionary containing a "conflict" key with a boolean value.
 
-        # Check if any index is in range; if not, assign by position
-        any_in_range = any(0 <= idx < n for idx, _ in valid_entries)
-        if not any_in_range and len(valid_entries) <= n:
-            # LLM returned wrong indices (e.g. word indices); use order: first -> 0, second -> 1, ...
-            valid_entries = [(i, sent) for i, (_, sent) in enumerate(valid_entries)]
+        Returns
+        -------
+        MappingProxyType
+            The finalized annotations, as returned by ``finalize``.
 
-        for idx, sent in valid_entries:
-            if 0 <= idx < n:
-                self.ssm[idx]["sentiment"] = sent
-            elif idx >= n:
-                pass  # skip out-of-range
+        Examples
+        --------
+        >>> annotator = Annotator([{"text": "example"}])
+        >>> annotator.apply({"sentiments": [{"index": 0, "sentiment": "Positive"}]},
+        ...                 {"profanity": [{"index": 0, "profane": False}]},
+        ...                 {"summary": "This is a summary."}, {"conflict": False})
+        """
+        s_idxs, s_codes = self._sentiment_arrays(sentiment_results)
+        p_idxs, p_flags = self._profanity_arrays(profane_results)
+        self._scatter(s_idxs, s_codes, p_idxs, p_flags)
 
-        for item in self.ssm:
-            item.setdefault("sentiment", "Neutral")
+        self.add_summary(summary_result)
+        self.add_conflict(conflict_result)
+        return self.finalize()
+
+    def add_sentiment(
+            self,
+            sentiment_results: Annotated[Any, "Sentiment analysis results: dict with 'sentiments' key or list of {index, sentiment}"]
+    ) -> "Annotator":
+        """
+        Adds sentiment data to the SSM. Accepts either {"sentiments": [...]} or a raw list.
+        Handles out-of-range indices by applying in-range ones; if all indices are wrong,
+        assigns by position (first item -> index 0, etc.). Returns the annotator for chaining.
+        """
+        s_idxs, s_codes = self._sentiment_arrays(sentiment_results)
+        self._scatter(s_idxs, s_codes, _NO_INDICES, _NO_FLAGS)
+        return self
 
     def add_profanity(
             self,
             profane_results: Annotated[Dict[str, Any], "Profanity detection results"]
-    ) -> List[Dict[str, Any]]:
+    ) -> "Annotator":
         """
         Adds profanity data to the SSM.
 
@@ -102,8 +204,9 @@ class Annotator:
 
         Returns
         -------
-        list of dict
-            The updated SSM with profanity annotations.
+        Annotator
+            The annotator, for chaining; profanity flags are written to the
+            SSM by ``finalize``.
 
         Examples
         --------
@@ -111,37 +214,118 @@ class Annotator:
         >>> results = {"profanity": [{"index": 0, "profane": True}]}
         >>> annotator.add_profanity(profane_results)
         """
-        if not profane_results or "profanity" not in profane_results:
-            print("Warning: 'profanity' key is missing in profane_results. Defaulting to False.")
-            for item in self.ssm:
-                item.setdefault("profane", False)
-            return self.ssm
+        p_idxs, p_flags = self._profanity_arrays(profane_results)
+        self._scatter(_NO_INDICES, _NO_CODES, p_idxs, p_flags)
+        return self
+
+    def _scatter(
+            self,
+            s_idxs: np.ndarray,
+            s_codes: np.ndarray,
+            p_idxs: np.ndarray,
+            p_flags: np.ndarray
+    ):
+        """
+        Writes validated sentiment and profanity arrays into the columns.
+        """
+        _fuse(
+            self._sentiment, self._sent_set, self._profane, self._prof_set,
+            s_idxs, s_codes, p_idxs, p_flags
+        )
+
+    def _sentiment_arrays(self, sentiment_results: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Validates sentiment results into (indices, int8 codes) arrays.
+
+        Besides a list of {index, sentiment} dicts, accepts the columnar form
+        {"indices": [...], "sentiments": [...]}.
+        """
+        # Normalize: accept raw list (LLM sometimes returns array instead of object)
+        if isinstance(sentiment_results, list):
+            sentiments_list = sentiment_results
+        else:
+            try:
+                sentiments_list = sentiment_results["sentiments"]
+            except (TypeError, KeyError):
+                logger.warning("'sentiments' key is missing in sentiment_results. Defaulting to Neutral.")
+                return _NO_INDICES, _NO_CODES
 
-        if len(profane_results["profanity"]) != len(self.ssm):
-            print(f"Mismatch: SSM Length = {len(self.ssm)}, "
-                  f"Profanity Length = {len(profane_results['profanity'])}")
-            print("Adjusting to match lengths...")
+        if not isinstance(sentiments_list, list):
+            return _NO_INDICES, _NO_CODES
 
-        if len(profane_results["profanity"]) < len(self.ssm):
-            for idx in range(len(profane_results["profanity"]), len(self.ssm)):
-                profane_results["profanity"].append({"index": idx, "profane": False})
+        n = len(self.ssm)
+        if isinstance(sentiment_results, dict) and "indices" in sentiment_results:
+            labels = sentiments_list
+            idxs = np.asarray(sentiment_results["indices"], dtype=np.int64)[:len(labels)]
+            labels = labels[:len(idxs)]
+        else:
+            # One pass over the entries, keeping those that carry a sentiment
+            index_list = []
+            labels = []
+            for entry in sentiments_list:
+                if isinstance(entry, dict) and "sentiment" in entry:
+                    index_list.append(entry.get("index", -1))
+                    labels.append(entry["sentiment"])
+            idxs = np.array(index_list, dtype=np.int64)
+
+        count = len(labels)
+        # Unknown labels become Neutral via SENTIMENT_CODES.__missing__;
+        # unhashable ones (e.g. a list) only fail the fast path
+        try:
+            codes = np.fromiter(map(SENTIMENT_CODES.__getitem__, labels), dtype=np.int8, count=count)
+        except TypeError:
+            codes = np.fromiter(
+                (SENTIMENT_CODES[label] if isinstance(label, str) else CODE_NEUTRAL for label in labels),
+                dtype=np.int8,
+                count=count
+            )
+
+        if _all_in_range(idxs, n):
+            return idxs, codes
+
+        # Check if any index is in range; if not, assign by position
+        if not ((0 <= idxs) & (idxs < n)).any() and count <= n:
+            # LLM returned wrong indices (e.g. word indices); use order: first -> 0, second -> 1, ...
+            return np.arange(count, dtype=np.int64), codes
 
-        elif len(profane_results["profanity"]) > len(self.ssm):
-            profane_results["profanity"] = profane_results["profanity"][:len(self.ssm)]
+        return _keep_in_range(idxs, codes, n, "sentiment")
 
-        for profanity_data in profane_results["profanity"]:
-            idx = profanity_data["index"]
-            if idx < len(self.ssm):
-                self.ssm[idx]["profane"] = profanity_data["profane"]
-            else:
-                print(f"Skipping profanity data at index {idx}, out of range.")
+    def _profanity_arrays(self, profane_results: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Validates profanity results into (indices, bool flags) arrays.
 
-        return self.ssm
+        Besides {"profanity": [{index, profane}, ...]}, accepts the columnar
+        form {"indices": [...], "profanity": [...]}.
+        """
+        try:
+            profanity = profane_results["profanity"]
+        except (TypeError, KeyError):
+            logger.warning("'profanity' key is missing in profane_results. Defaulting to False.")
+            return _NO_INDICES, _NO_FLAGS
+
+        n = len(self.ssm)
+        m = len(profanity)
+
+        if m != n:
+            logger.warning("Mismatch: SSM Length = %d, Profanity Length = %d. "
+                           "Adjusting to match lengths...", n, m)
+
+        # Missing entries keep the False already in the column; extra ones are dropped
+        profanity = profanity[:n]
+        if "indices" in profane_results:
+            idxs = np.asarray(profane_results["indices"], dtype=np.int64)[:len(profanity)]
+            flags = np.asarray(profanity[:len(idxs)], dtype=bool)
+        else:
+            count = len(profanity)
+            idxs = np.fromiter(map(_get_profane_index, profanity), dtype=np.int64, count=count)
+            flags = np.fromiter(map(_get_profane, profanity), dtype=bool, count=count)
+
+        return _keep_in_range(idxs, flags, n, "profanity")
 
     def add_summary(
             self,
             summary_result: Annotated[Dict[str, str], "Summary results"]
-    ) -> Dict[str, Any]:
+    ) -> "Annotator":
         """
         Adds a global summary to the annotations.
 
@@ -152,8 +336,8 @@ class Annotator:
 
         Returns
         -------
-        dict
-            The updated SSM and global summary.
+        Annotator
+            The annotator, for chaining.
 
         Examples
         --------
@@ -161,17 +345,16 @@ class Annotator:
         >>> result = {"summary": "This is a summary."}
         >>> annotator.add_summary(summary_result)
         """
-        if not summary_result or "summary" not in summary_result:
-            print("Warning: 'summary' key is missing in summary_result.")
-            return {"ssm": self.ssm, "summary": self.global_summary}
-
-        self.global_summary = summary_result["summary"]
-        return {"ssm": self.ssm, "summary": self.global_summary}
+        try:
+            self.global_summary = summary_result["summary"]
+        except (TypeError, KeyError):
+            logger.warning("'summary' key is missing in summary_result.")
+        return self
 
     def add_conflict(
             self,
             conflict_result: Annotated[Dict[str, bool], "Conflict detection results"]
-    ) -> Dict[str, Any]:
+    ) -> "Annotator":
         """
         Adds a global conflict status to the annotations.
 
@@ -182,8 +365,8 @@ class Annotator:
 
         Returns
         -------
-        dict
-            The updated SSM and global conflict status.
+        Annotator
+            The annotator, for chaining.
 
         Examples
         --------
@@ -191,35 +374,62 @@ class Annotator:
         >>> result = {"conflict": True}
         >>> annotator.add_conflict(conflict_result)
         """
-        if not conflict_result or "conflict" not in conflict_result:
-            print("Warning: 'conflict' key is missing in conflict_result.")
-            return {"ssm": self.ssm, "conflict": self.global_conflict}
-
-        self.global_conflict = conflict_result["conflict"]
-        return {"ssm": self.ssm, "conflict": self.global_conflict}
+        try:
+            self.global_conflict = conflict_result["conflict"]
+        except (TypeError, KeyError):
+            logger.warning("'conflict' key is missing in conflict_result.")
+        return self
 
-    def finalize(self) -> Dict[str, Any]:
+    def finalize(self) -> Mapping[str, Any]:
         """
         Finalizes the annotations by returning the updated SSM along with
         global annotations for summary, conflict, and topic.
 
+        The result is read-only and the SSM rows are returned as a tuple, so
+        callers can hold on to it without copying. The row dictionaries
+        themselves are the annotator's own and should be treated as read-only.
+
         Returns
         -------
-        dict
-            A dictionary containing the updated SSM and global annotations.
+        MappingProxyType
+            A read-only mapping containing the updated SSM and global annotations.
 
         Examples
         --------
         >>> annotator = Annotator([{"text": "example"}])
-        >>> annotator.finalize()
-        {'ssm': [{'text': 'example'}], 'summary': '', 'conflict': False}
+        >>> dict(annotator.finalize())
+        {'ssm': ({'text': 'example', 'sentiment': 'Neutral', 'profane': False},), 'summary': '', 'conflict': False}
         """
-        for item in self.ssm:
-            item.setdefault("sentiment", "Neutral")
-            item.setdefault("profane", False)
-
-        return {
-            "ssm": self.ssm,
+        ssm = self.ssm
+        codes = self._sentiment.tolist()
+        flags = self._profane.tolist()
+        neutral = SENTIMENT_LABELS[CODE_NEUTRAL]
+
+        # Fast path: every row was assigned, so there are no defaults to fill
+        if self._sent_set.all():
+            for item, code in zip(ssm, codes):
+                item["sentiment"] = SENTIMENT_LABELS[code]
+        else:
+            for i in np.flatnonzero(self._sent_set).tolist():
+                ssm[i]["sentiment"] = SENTIMENT_LABELS[codes[i]]
+            for i in np.flatnonzero(~self._sent_set).tolist():
+                item = ssm[i]
+                if "sentiment" not in item:
+                    item["sentiment"] = neutral
+
+        if self._prof_set.all():
+            for item, flag in zip(ssm, flags):
+                item["profane"] = flag
+        else:
+            for i in np.flatnonzero(self._prof_set).tolist():
+                ssm[i]["profane"] = flags[i]
+            for i in np.flatnonzero(~self._prof_set).tolist():
+                item = ssm[i]
+                if "profane" not in item:
+                    item["profane"] = False
+
+        return MappingProxyType({
+            "ssm": tuple(ssm),
             "summary": self.global_summary,
             "conflict": self.global_conflict
-        }
+        })